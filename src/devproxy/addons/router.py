@@ -1,13 +1,20 @@
 """mitmproxy addon for subdomain-based routing."""
 
+import functools
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 
 from mitmproxy import ctx, http
 
+# Keys used to pass routing info between hooks via flow.metadata
+METADATA_SUBDOMAIN = "devproxy_subdomain"
+METADATA_TARGET = "devproxy_target"
+METADATA_UNROUTED = "devproxy_unrouted"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RequestRecord:
     """Record of a proxied request for logging/inspection."""
 
@@ -37,7 +44,7 @@ class RouterAddon:
 
     def __init__(
         self,
-        routes: dict[str, tuple[str, int]],
+        routes: Mapping[str, tuple[str, int]],
         domain: str,
         on_request: Callable[[RequestRecord], None] | None = None,
         verbose: bool = False,
@@ -51,15 +58,27 @@ class RouterAddon:
             on_request: Optional callback invoked for each completed request.
             verbose: If True, log requests to console.
         """
-        self.routes = routes
+        # Private dict copy: plain dict lookups are the fastest on the request
+        # path, and the table can't change underneath a running proxy
+        self.routes = dict(routes)
         self.domain = domain
         self.on_request = on_request
         self.verbose = verbose
 
-        # Track request start times for duration calculation
-        self._request_times: dict[str, float] = {}
-        # Limit tracked requests to prevent memory leak from orphaned entries
+        # Precompute the domain suffix used for subdomain extraction
+        self._suffix = f".{domain}"
+        self._suffix_len = len(self._suffix)
+        # Browsers hit the same few hosts over and over; memoize the lookup
+        # per addon, bounded so arbitrary proxied hosts can't grow it forever
+        self._extract_subdomain = functools.lru_cache(maxsize=1024)(self._extract_subdomain)
+
+        # Track request start times for duration calculation, keyed by flow.id.
+        # Insertion order doubles as age order, so the oldest entry is evicted
+        # first once the cap is reached (orphaned entries from aborted flows).
+        self._request_times: OrderedDict[str, float] = OrderedDict()
         self._max_tracked_requests = 10000
+        # Entries older than this (seconds) are treated as orphaned
+        self._request_ttl = 300.0
 
     def _extract_subdomain(self, hostname: str) -> str | None:
         """Extract the subdomain from a hostname.
@@ -70,56 +89,78 @@ class RouterAddon:
         Returns:
             Subdomain string or None if not matching our domain.
         """
+        # Cheap reject for hostnames too short to carry a subdomain
+        if len(hostname) <= self._suffix_len:
+            return None
         # Check if hostname ends with our domain
-        suffix = f".{self.domain}"
-        if hostname.endswith(suffix):
-            subdomain = hostname[: -len(suffix)]
+        if hostname.endswith(self._suffix):
+            subdomain = hostname[: -self._suffix_len]
             # Handle case of exactly one subdomain level
             if subdomain and "." not in subdomain:
                 return subdomain
         return None
 
-    def _get_flow_id(self, flow: http.HTTPFlow) -> str:
-        """Get a unique ID for a flow to track timing."""
-        return str(id(flow))
+    def _expire_request_times(self, now: float) -> None:
+        """Drop tracked start times older than the TTL.
+
+        Entries are inserted in start-time order, so expired ones are always at
+        the front and the sweep stops at the first live entry.
+
+        Args:
+            now: Current monotonic time.
+        """
+        cutoff = now - self._request_ttl
+        request_times = self._request_times
+        while request_times and next(iter(request_times.values())) < cutoff:
+            request_times.popitem(last=False)
 
     def request(self, flow: http.HTTPFlow) -> None:
         """Handle incoming request - route based on subdomain.
 
         This is called by mitmproxy for each incoming request.
         """
-        # Cleanup old entries if dict grows too large (prevents memory leak)
-        if len(self._request_times) > self._max_tracked_requests:
-            cutoff = time.time() - 300  # Remove entries older than 5 minutes
-            self._request_times = {k: v for k, v in self._request_times.items() if v > cutoff}
+        now = time.monotonic()
 
-        # Record start time
-        self._request_times[self._get_flow_id(flow)] = time.time()
+        # Drop orphaned entries from flows that never completed, then enforce
+        # the hard cap in case of a burst (prevents memory leak)
+        self._expire_request_times(now)
+        if len(self._request_times) >= self._max_tracked_requests:
+            self._request_times.popitem(last=False)
+
+        # Record start time (monotonic, only used for duration math). A replayed
+        # flow reuses its id, so move it to the end to keep oldest-first order.
+        self._request_times[flow.id] = now
+        self._request_times.move_to_end(flow.id)
 
         # Get the hostname from the request
-        hostname = flow.request.pretty_host
+        req = flow.request
+        hostname = req.pretty_host
 
         # Extract subdomain
         subdomain = self._extract_subdomain(hostname)
 
-        if subdomain and subdomain in self.routes:
-            target_host, target_port = self.routes[subdomain]
+        route = self.routes.get(subdomain) if subdomain else None
+
+        if route is not None:
+            target_host, target_port = route
 
             # Rewrite the request to target the local service over HTTP
-            flow.request.scheme = "http"
-            flow.request.host = target_host
-            flow.request.port = target_port
+            req.scheme = "http"
+            req.host = target_host
+            req.port = target_port
 
             # Store routing info in flow for response handler
-            flow.metadata["devproxy_subdomain"] = subdomain
-            flow.metadata["devproxy_target"] = (target_host, target_port)
+            metadata = flow.metadata
+            metadata[METADATA_SUBDOMAIN] = subdomain
+            metadata[METADATA_TARGET] = route
 
             if self.verbose:
                 ctx.log.alert(f"Routing {subdomain}.{self.domain} -> {target_host}:{target_port}")
         elif subdomain:
             # Subdomain matches our domain pattern but no route configured
-            flow.metadata["devproxy_subdomain"] = subdomain
-            flow.metadata["devproxy_unrouted"] = True
+            metadata = flow.metadata
+            metadata[METADATA_SUBDOMAIN] = subdomain
+            metadata[METADATA_UNROUTED] = True
             if self.verbose:
                 ctx.log.alert(f"No route configured for subdomain: {subdomain}")
 
@@ -128,21 +169,27 @@ class RouterAddon:
 
         This is called by mitmproxy when a response is received.
         """
-        flow_id = self._get_flow_id(flow)
-        start_time = self._request_times.pop(flow_id, None)
+        start_time = self._request_times.pop(flow.id, None)
+
+        # Nothing consumes the record, so don't build it
+        if self.on_request is None and not self.verbose:
+            return
 
-        duration_ms = (time.time() - start_time) * 1000 if start_time else 0
+        duration_ms = (time.monotonic() - start_time) * 1000 if start_time is not None else 0
 
-        subdomain = flow.metadata.get("devproxy_subdomain")
-        target = flow.metadata.get("devproxy_target", ("unknown", 0))
+        req = flow.request
+        resp = flow.response
+        metadata = flow.metadata
+        subdomain = metadata.get(METADATA_SUBDOMAIN)
+        target = metadata.get(METADATA_TARGET, ("unknown", 0))
 
         record = RequestRecord(
-            method=flow.request.method,
-            url=flow.request.pretty_url,
+            method=req.method,
+            url=req.pretty_url,
             subdomain=subdomain,
             target_host=target[0],
             target_port=target[1],
-            status_code=flow.response.status_code if flow.response else None,
+            status_code=resp.status_code if resp else None,
             duration_ms=duration_ms,
             timestamp=time.time(),
         )
@@ -153,16 +200,17 @@ class RouterAddon:
 
         # Log if verbose
         if self.verbose:
-            status = record.status_code or "---"
-            ctx.log.alert(f"{record.method} {status} {record.duration_ms:.0f}ms {record.url}")
+            ctx.log.alert(str(record))
 
     def error(self, flow: http.HTTPFlow) -> None:
         """Handle errors in request processing."""
-        flow_id = self._get_flow_id(flow)
-        self._request_times.pop(flow_id, None)
-
-        subdomain = flow.metadata.get("devproxy_subdomain", "unknown")
-        error_msg = flow.error.msg if flow.error else "Unknown error"
+        self._request_times.pop(flow.id, None)
 
         if self.verbose:
+            subdomain = flow.metadata.get(METADATA_SUBDOMAIN, "unknown")
+            error_msg = flow.error.msg if flow.error else "Unknown error"
             ctx.log.alert(f"Error for {subdomain}: {error_msg}")
+
+    def done(self) -> None:
+        """Release tracked request state when mitmproxy shuts down."""
+        self._request_times.clear()
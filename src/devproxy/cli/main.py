@@ -1,10 +1,15 @@
 """CLI interface for devproxy."""
 
 import asyncio
+import contextlib
+import dataclasses
+import functools
+import json
 import signal
 import sys
+from enum import StrEnum
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 from rich.console import Console
@@ -12,7 +17,6 @@ from rich.panel import Panel
 from rich.table import Table
 
 from devproxy import __version__
-from devproxy.addons.router import RequestRecord
 from devproxy.config.settings import generate_default_config, load_settings
 from devproxy.models.config import CertsConfig
 from devproxy.services.cert_service import (
@@ -21,7 +25,10 @@ from devproxy.services.cert_service import (
     MkcertNotFoundError,
 )
 from devproxy.services.hosts_service import HostsFileError, HostsService
-from devproxy.services.proxy_service import ProxyService, ProxyStartError
+
+if TYPE_CHECKING:
+    # mitmproxy-backed modules are imported lazily in `up` to keep startup fast
+    from devproxy.addons.router import RequestRecord
 
 app = typer.Typer(
     name="devproxy",
@@ -33,6 +40,18 @@ app = typer.Typer(
 console = Console()
 error_console = Console(stderr=True)
 
+# Verbose request log buffering (oldest records are dropped when full)
+REQUEST_LOG_QUEUE_SIZE = 1024
+REQUEST_LOG_BATCH_SIZE = 32
+
+
+class LogFormat(StrEnum):
+    """Output format for verbose request logging."""
+
+    RICH = "rich"
+    PLAIN = "plain"
+    JSON = "json"
+
 
 def _print_error(message: str) -> None:
     """Print an error message to stderr."""
@@ -49,6 +68,81 @@ def _print_warning(message: str) -> None:
     console.print(f"[bold yellow]![/bold yellow] {message}")
 
 
+def _format_request(record: "RequestRecord") -> str:
+    """Format a request record as a Rich markup log line."""
+    status_color = "green" if record.status_code and record.status_code < 400 else "red"
+    return (
+        f"[dim]{record.method:6}[/dim] "
+        f"[{status_color}]{record.status_code or '---':>3}[/{status_color}] "
+        f"[dim]{record.duration_ms:>6.0f}ms[/dim] "
+        f"{record.url}"
+    )
+
+
+def _print_request_batch(batch: "list[RequestRecord]", log_format: LogFormat) -> None:
+    """Print a batch of request records in a single write.
+
+    The plain and JSON formats bypass Rich and write straight to stdout.
+    """
+    if log_format is LogFormat.RICH:
+        console.print("\n".join(_format_request(record) for record in batch))
+        return
+
+    if log_format is LogFormat.JSON:
+        lines = [json.dumps(dataclasses.asdict(record)) for record in batch]
+    else:
+        lines = [str(record) for record in batch]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _enqueue_request(queue: "asyncio.Queue[RequestRecord]", record: "RequestRecord") -> None:
+    """Queue a completed request record for printing.
+
+    When the queue is full the oldest record is dropped, so a burst of
+    traffic can't grow the log buffer without bound.
+
+    Args:
+        queue: Bounded queue drained by _drain_request_log.
+        record: Completed request record.
+    """
+    try:
+        queue.put_nowait(record)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(record)
+
+
+async def _drain_request_log(queue: "asyncio.Queue[RequestRecord]", log_format: LogFormat) -> None:
+    """Print queued request records until cancelled.
+
+    Records that arrive together are coalesced into one write. The write is
+    still synchronous on the proxy's event loop, so console output blocks
+    the proxy once per batch rather than once per request.
+
+    Args:
+        queue: Queue of completed request records.
+        log_format: Output format for each record.
+    """
+    while True:
+        batch = [await queue.get()]
+        while not queue.empty() and len(batch) < REQUEST_LOG_BATCH_SIZE:
+            batch.append(queue.get_nowait())
+        _print_request_batch(batch, log_format)
+
+
+def _flush_request_log(queue: "asyncio.Queue[RequestRecord]", log_format: LogFormat) -> None:
+    """Print any records still queued after the drain task has stopped.
+
+    Args:
+        queue: Queue of completed request records.
+        log_format: Output format for each record.
+    """
+    remaining = [queue.get_nowait() for _ in range(queue.qsize())]
+    if remaining:
+        _print_request_batch(remaining, log_format)
+
+
 @app.command()
 def up(
     config: Annotated[
@@ -75,8 +169,14 @@ def up(
         bool,
         typer.Option("--verbose", "-v", help="Print requests to console"),
     ] = False,
+    log_format: Annotated[
+        LogFormat,
+        typer.Option("--log-format", help="Request log format (with --verbose)"),
+    ] = LogFormat.RICH,
 ) -> None:
     """Start the development proxy server."""
+    from devproxy.services.proxy_service import ProxyService, ProxyStartError
+
     try:
         # Load settings with CLI overrides
         overrides: dict[str, Any] = {}
@@ -150,41 +250,36 @@ def up(
         table.add_column("URL", style="green")
         table.add_column("Target", style="yellow")
 
-        port_suffix = f":{settings.proxy.https_port}" if settings.proxy.https_port != 443 else ""
+        service_urls = settings.get_service_urls()
+        route_table = settings.get_route_table()
 
-        for name, svc in settings.get_enabled_services().items():
-            url = f"https://{name}.{settings.domain}{port_suffix}"
-            target = f"{svc.host}:{svc.port}"
-            table.add_row(name, url, target)
+        for name, (target_host, target_port) in route_table.items():
+            table.add_row(name, service_urls[name], f"{target_host}:{target_port}")
 
         console.print(table)
         console.print()
 
-        # Create request logger if verbose
-        def log_request(record: RequestRecord) -> None:
-            status_color = "green" if record.status_code and record.status_code < 400 else "red"
-            console.print(
-                f"[dim]{record.method:6}[/dim] "
-                f"[{status_color}]{record.status_code or '---':>3}[/{status_color}] "
-                f"[dim]{record.duration_ms:>6.0f}ms[/dim] "
-                f"{record.url}"
-            )
+        # Create request logger if verbose. Records are queued here and printed
+        # in batches by a background task on the same event loop, so console
+        # output blocks the proxy once per batch instead of once per request.
+        log_queue: asyncio.Queue[RequestRecord] = asyncio.Queue(maxsize=REQUEST_LOG_QUEUE_SIZE)
 
         # Create proxy
         proxy = ProxyService(
             proxy_config=settings.proxy,
             domain=settings.domain,
-            routes=settings.get_route_table(),
+            routes=route_table,
             cert_file=cert_paths.cert_file,
             key_file=cert_paths.key_file,
             verbose=verbose,
-            on_request=log_request if verbose else None,
+            on_request=functools.partial(_enqueue_request, log_queue) if verbose else None,
         )
 
         # Set up signal handlers
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         shutdown_task: asyncio.Task[None] | None = None
+        log_task = loop.create_task(_drain_request_log(log_queue, log_format)) if verbose else None
 
         def handle_signal(_sig: int, _frame: object) -> None:
             nonlocal shutdown_task
@@ -206,14 +301,19 @@ def up(
             console.print("[dim]Press Ctrl+C to stop[/dim]")
             console.print()
 
-            # Run the proxy (master is guaranteed to exist after start())
-            assert proxy._master is not None
-            loop.run_until_complete(proxy._run_master(proxy._master))
+            # Run the already-started proxy until shutdown
+            loop.run_until_complete(proxy.run())
         except ProxyStartError as e:
             _print_error(str(e))
             raise typer.Exit(1) from None
         finally:
             loop.run_until_complete(proxy.shutdown())
+            if log_task is not None:
+                log_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    loop.run_until_complete(log_task)
+                # Flush anything logged after the drain task's last pass
+                _flush_request_log(log_queue, log_format)
             loop.close()
 
     except MkcertNotFoundError as e:
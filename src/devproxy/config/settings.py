@@ -1,9 +1,10 @@
 """Settings management with YAML file and environment variable support."""
 
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -76,13 +77,15 @@ class DevProxySettings(BaseSettings):
         """Get only enabled services."""
         return {name: config for name, config in self.services.items() if config.enabled}
 
-    def get_route_table(self) -> dict[str, tuple[str, int]]:
-        """Get routing table mapping subdomains to (host, port) tuples."""
-        return {
-            name: (config.host, config.port)
-            for name, config in self.services.items()
-            if config.enabled
-        }
+    def get_route_table(self) -> Mapping[str, tuple[str, int]]:
+        """Get read-only routing table mapping subdomains to (host, port) tuples."""
+        return MappingProxyType(
+            {
+                name: (config.host, config.port)
+                for name, config in self.services.items()
+                if config.enabled
+            }
+        )
 
     def to_config(self) -> DevProxyConfig:
         """Convert settings to a DevProxyConfig model."""
@@ -98,11 +101,22 @@ class DevProxySettings(BaseSettings):
 
 def _load_yaml_file(path: Path) -> dict[str, Any]:
     """Load and parse a YAML configuration file."""
-    if not path.exists():
+    # Read directly rather than checking exists() first: one syscall fewer,
+    # and no window for the file to vanish between the check and the read
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
         return {}
 
-    with path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Imported here so commands that never read a config (--help, init)
+    # don't pay for loading PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+    # Hand libyaml the raw bytes; it decodes UTF-8 itself, skipping a str copy
+    data = yaml.load(content, Loader=loader)
 
     return data if data else {}
 
@@ -161,11 +175,12 @@ def load_settings(
     # Filter out None values from overrides
     filtered_overrides = {k: v for k, v in overrides.items() if v is not None}
 
-    # Merge: YAML config provides base, overrides take precedence
+    # Merge: YAML config provides base, overrides take precedence. The parsed
+    # dict is fresh and not shared, so merge into it in place.
     # Environment variables are handled automatically by pydantic-settings
-    merged_config = {**yaml_config, **filtered_overrides}
+    yaml_config |= filtered_overrides
 
-    settings = DevProxySettings(**merged_config)
+    settings = DevProxySettings(**yaml_config)
     settings._config_path = found_path
 
     return settings
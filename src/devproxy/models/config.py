@@ -1,10 +1,13 @@
 """Pydantic models for devproxy configuration."""
 
 import re
+from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
-from typing import Annotated, Any, cast
+from types import MappingProxyType
+from typing import Annotated, Any, NamedTuple, Self, cast
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 # Domain name validation pattern (RFC 1123 compliant)
 DOMAIN_PATTERN = re.compile(
@@ -18,6 +21,8 @@ class ServiceConfig(BaseModel):
     Supports both simple syntax (just port) and extended syntax (full config).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     port: int = Field(..., ge=1, le=65535, description="Port number the service runs on")
     host: str = Field(default="localhost", description="Host where the service runs")
     enabled: bool = Field(default=True, description="Whether routing to this service is enabled")
@@ -34,6 +39,8 @@ class ServiceConfig(BaseModel):
 class ProxyConfig(BaseModel):
     """Configuration for the proxy server."""
 
+    model_config = ConfigDict(frozen=True)
+
     https_port: int = Field(
         default=6789,
         ge=1,
@@ -55,6 +62,8 @@ class ProxyConfig(BaseModel):
 class CertsConfig(BaseModel):
     """Configuration for TLS certificates."""
 
+    model_config = ConfigDict(frozen=True)
+
     cert_dir: Path = Field(
         default=Path("~/.devproxy/certs"),
         description="Directory to store generated certificates",
@@ -98,8 +107,22 @@ class CertsConfig(BaseModel):
 ServiceConfigInput = int | ServiceConfig | dict[str, int | str | bool]
 
 
+class _ServiceTables(NamedTuple):
+    """Derived tables over the enabled services of a DevProxyConfig."""
+
+    urls: dict[str, str]
+    enabled: dict[str, ServiceConfig]
+    routes: dict[str, tuple[str, int]]
+
+
 class DevProxyConfig(BaseModel):
-    """Root configuration model for devproxy."""
+    """Root configuration model for devproxy.
+
+    The model is frozen, so the derived service tables are built once and
+    handed out as read-only views.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     domain: str = Field(
         default="local.stridelabs.ai",
@@ -134,6 +157,10 @@ class DevProxyConfig(BaseModel):
         if v is None:
             return {}
 
+        # Fast path: already normalized (e.g. DevProxySettings.to_config)
+        if all(type(config) is ServiceConfig for config in v.values()):
+            return cast(dict[str, ServiceConfig], v)
+
         result: dict[str, ServiceConfig] = {}
         for name, config in v.items():
             if isinstance(config, int):
@@ -168,22 +195,39 @@ class DevProxyConfig(BaseModel):
             )
         return cleaned
 
-    def get_service_urls(self) -> dict[str, str]:
-        """Get mapping of service names to their full URLs."""
-        return {
-            name: f"https://{name}.{self.domain}"
-            for name, config in self.services.items()
-            if config.enabled
-        }
-
-    def get_enabled_services(self) -> dict[str, ServiceConfig]:
-        """Get only enabled services."""
-        return {name: config for name, config in self.services.items() if config.enabled}
-
-    def get_route_table(self) -> dict[str, tuple[str, int]]:
-        """Get routing table mapping subdomains to (host, port) tuples."""
-        return {
-            name: (config.host, config.port)
-            for name, config in self.services.items()
-            if config.enabled
-        }
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model, dropping cached service tables when fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # The cached tables were copied along with the fields; rebuild lazily
+            copied.__dict__.pop("_service_tables", None)
+        return copied
+
+    @cached_property
+    def _service_tables(self) -> _ServiceTables:
+        """Build the URL, enabled-service, and route tables in a single pass.
+
+        The tables are plain dicts so the model still deep-copies and pickles;
+        getters wrap them in read-only views on the way out.
+        """
+        urls: dict[str, str] = {}
+        enabled: dict[str, ServiceConfig] = {}
+        routes: dict[str, tuple[str, int]] = {}
+        for name, config in self.services.items():
+            if config.enabled:
+                urls[name] = f"https://{name}.{self.domain}"
+                enabled[name] = config
+                routes[name] = (config.host, config.port)
+        return _ServiceTables(urls=urls, enabled=enabled, routes=routes)
+
+    def get_service_urls(self) -> Mapping[str, str]:
+        """Get read-only mapping of service names to their full URLs."""
+        return MappingProxyType(self._service_tables.urls)
+
+    def get_enabled_services(self) -> Mapping[str, ServiceConfig]:
+        """Get read-only mapping of only enabled services."""
+        return MappingProxyType(self._service_tables.enabled)
+
+    def get_route_table(self) -> Mapping[str, tuple[str, int]]:
+        """Get read-only routing table mapping subdomains to (host, port) tuples."""
+        return MappingProxyType(self._service_tables.routes)
@@ -1,11 +1,28 @@
 """Service layer for devproxy."""
 
+from typing import TYPE_CHECKING
+
 from devproxy.services.cert_service import CertService
 from devproxy.services.hosts_service import HostsService
-from devproxy.services.proxy_service import ProxyService
+
+if TYPE_CHECKING:
+    from devproxy.services.proxy_service import ProxyService
 
 __all__ = [
     "CertService",
     "HostsService",
     "ProxyService",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import ProxyService on first access.
+
+    ProxyService pulls in mitmproxy, which dominates import time, so commands
+    that only need certificates or hosts management don't pay for it.
+    """
+    if name == "ProxyService":
+        from devproxy.services.proxy_service import ProxyService
+
+        return ProxyService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,13 @@
 
 import subprocess
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from devproxy.models.config import CertsConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CertPaths:
     """Paths to certificate and key files."""
 
@@ -31,6 +32,9 @@ class CertService:
     """Service for managing TLS certificates using mkcert.
 
     Handles certificate generation, CA installation checks, and cert path management.
+
+    The config and domain are fixed once the service is constructed, so the
+    certificate paths derived from them are computed only once.
     """
 
     def __init__(self, config: CertsConfig, domain: str):
@@ -75,22 +79,43 @@ class CertService:
                 "  Windows: choco install mkcert"
             ) from e
 
+    @cached_property
+    def _mkcert_version(self) -> str | None:
+        """Probe `mkcert -version` once per service instance.
+
+        Returns:
+            Version string, or None if mkcert is not installed or not working.
+        """
+        try:
+            result = self._run_mkcert("-version", check=False)
+        except MkcertNotFoundError:
+            return None
+        if result.returncode == 0:
+            return result.stdout.strip() or result.stderr.strip()
+        return None
+
+    @cached_property
+    def _ca_root(self) -> Path | None:
+        """Look up the mkcert CA root directory once per service instance.
+
+        Returns:
+            CA root path, or None if mkcert is not installed or the lookup fails.
+        """
+        try:
+            result = self._run_mkcert("-CAROOT", check=False)
+        except MkcertNotFoundError:
+            return None
+        if result.returncode == 0:
+            return Path(result.stdout.strip())
+        return None
+
     def check_mkcert_installed(self) -> bool:
         """Check if mkcert is installed and accessible.
 
         Returns:
             True if mkcert is installed, False otherwise.
         """
-        try:
-            result = subprocess.run(
-                ["mkcert", "-version"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return self._mkcert_version is not None
 
     def get_mkcert_version(self) -> str | None:
         """Get the installed mkcert version.
@@ -98,13 +123,7 @@ class CertService:
         Returns:
             Version string, or None if mkcert is not installed.
         """
-        try:
-            result = self._run_mkcert("-version", check=False)
-            if result.returncode == 0:
-                return result.stdout.strip() or result.stderr.strip()
-            return None
-        except MkcertNotFoundError:
-            return None
+        return self._mkcert_version
 
     def is_ca_installed(self) -> bool:
         """Check if the mkcert CA is installed in the system trust store.
@@ -113,16 +132,12 @@ class CertService:
             True if the CA appears to be installed.
         """
         # mkcert doesn't have a direct "check CA" command, but we can check
-        # if the CA root directory exists and has the CA files
-        try:
-            result = self._run_mkcert("-CAROOT", check=False)
-            if result.returncode == 0:
-                ca_root = Path(result.stdout.strip())
-                root_cert = ca_root / "rootCA.pem"
-                return root_cert.exists()
-            return False
-        except MkcertNotFoundError:
+        # if the CA root directory exists and has the CA files. Only the
+        # directory lookup is cached, so this reflects a later install_ca().
+        ca_root = self._ca_root
+        if ca_root is None:
             return False
+        return (ca_root / "rootCA.pem").exists()
 
     def install_ca(self) -> None:
         """Install the mkcert CA into the system trust store.
@@ -135,8 +150,11 @@ class CertService:
         """
         self._run_mkcert("-install")
 
-    def _get_cert_paths(self) -> CertPaths:
-        """Get the paths where certificates should be stored.
+    @cached_property
+    def cert_paths(self) -> CertPaths:
+        """Paths where certificates should be stored.
+
+        Computed once per service, since config and domain don't change.
 
         Returns:
             CertPaths with cert_file and key_file paths.
@@ -163,7 +181,7 @@ class CertService:
         Returns:
             True if both cert and key files exist.
         """
-        paths = self._get_cert_paths()
+        paths = self.cert_paths
         return paths.cert_file.exists() and paths.key_file.exists()
 
     def _generate_certs(self) -> CertPaths:
@@ -176,7 +194,7 @@ class CertService:
             MkcertNotFoundError: If mkcert is not installed.
             CertificateError: If certificate generation fails.
         """
-        paths = self._get_cert_paths()
+        paths = self.cert_paths
 
         # Ensure cert directory exists
         paths.cert_file.parent.mkdir(parents=True, exist_ok=True)
@@ -213,7 +231,7 @@ class CertService:
         """
         # If using custom certs, just verify they exist
         if self.config.cert_file and self.config.key_file:
-            paths = self._get_cert_paths()
+            paths = self.cert_paths
             if not paths.cert_file.exists():
                 raise CertificateError(f"Custom cert file not found: {paths.cert_file}")
             if not paths.key_file.exists():
@@ -222,7 +240,7 @@ class CertService:
 
         # Check if auto-generation is enabled
         if not self.config.auto_generate:
-            paths = self._get_cert_paths()
+            paths = self.cert_paths
             if not self.certs_exist():
                 raise CertificateError(
                     f"Certificates not found and auto_generate is disabled.\n"
@@ -235,7 +253,7 @@ class CertService:
         if force or not self.certs_exist():
             return self._generate_certs()
 
-        return self._get_cert_paths()
+        return self.cert_paths
 
     def get_cert_info(self) -> dict[str, str | bool | None]:
         """Get information about certificate status.
@@ -243,11 +261,14 @@ class CertService:
         Returns:
             Dictionary with certificate status information.
         """
-        paths = self._get_cert_paths()
+        paths = self.cert_paths
+        # Stat each file once and reuse the result for "exists"
+        cert_exists = paths.cert_file.exists()
+        key_exists = paths.key_file.exists()
         return {
-            "cert_file": str(paths.cert_file) if paths.cert_file.exists() else None,
-            "key_file": str(paths.key_file) if paths.key_file.exists() else None,
-            "exists": self.certs_exist(),
+            "cert_file": str(paths.cert_file) if cert_exists else None,
+            "key_file": str(paths.key_file) if key_exists else None,
+            "exists": cert_exists and key_exists,
             "mkcert_installed": self.check_mkcert_installed(),
             "mkcert_version": self.get_mkcert_version(),
             "ca_installed": self.is_ca_installed(),
@@ -1,7 +1,9 @@
 """Hosts file management service."""
 
 import os
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 # Markers for the managed block in hosts file
@@ -9,7 +11,7 @@ BEGIN_MARKER = "# BEGIN devproxy managed block"
 END_MARKER = "# END devproxy managed block"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HostsEntry:
     """Represents a single hosts file entry."""
 
@@ -20,12 +22,12 @@ class HostsEntry:
         return f"{self.ip} {self.hostname}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HostsChange:
     """Represents a change to be made to the hosts file."""
 
     action: str  # "add" or "remove"
-    entries: list[HostsEntry]
+    entries: tuple[HostsEntry, ...]
 
     @property
     def description(self) -> str:
@@ -47,13 +49,17 @@ class HostsService:
 
     Manages a dedicated block in the hosts file marked with BEGIN/END comments
     to avoid interfering with other entries.
+
+    The domain and services are fixed once the service is constructed; the
+    required entries derived from them are built once and not refreshed if
+    those attributes are reassigned.
     """
 
     def __init__(
         self,
         hosts_file: Path,
         domain: str,
-        services: dict[str, tuple[str, int]],
+        services: Mapping[str, tuple[str, int]],
     ):
         """Initialize the hosts service.
 
@@ -74,24 +80,35 @@ class HostsService:
         self.domain = domain
         self.services = services
 
-    def _read_hosts_file(self) -> list[str]:
-        """Read the hosts file content.
+    def _read_hosts_text(self) -> str:
+        """Read the raw hosts file content.
 
         Returns:
-            List of lines from the hosts file.
+            File content, or an empty string if the file doesn't exist.
 
         Raises:
             HostsFileError: If the file cannot be read.
         """
         try:
             if not self.hosts_file.exists():
-                return []
-            return self.hosts_file.read_text().splitlines()
+                return ""
+            return self.hosts_file.read_text()
         except PermissionError as e:
             raise HostsFileError(f"Cannot read {self.hosts_file}: Permission denied") from e
         except OSError as e:
             raise HostsFileError(f"Cannot read {self.hosts_file}: {e}") from e
 
+    def _read_hosts_file(self) -> list[str]:
+        """Read the hosts file content.
+
+        Returns:
+            List of lines from the hosts file.
+
+        Raises:
+            HostsFileError: If the file cannot be read.
+        """
+        return self._read_hosts_text().splitlines()
+
     def _write_hosts_file(self, lines: list[str]) -> None:
         """Write content to the hosts file.
 
@@ -147,31 +164,44 @@ class HostsService:
 
         return start_idx, end_idx
 
+    @cached_property
+    def _required_entries(self) -> tuple[HostsEntry, ...]:
+        """Hosts entries for all services, built once per service instance."""
+        return tuple(
+            HostsEntry(ip="127.0.0.1", hostname=f"{service_name}.{self.domain}")
+            for service_name in self.services
+        )
+
+    @cached_property
+    def _required_hostnames(self) -> frozenset[str]:
+        """Hostnames of all required entries."""
+        return frozenset(e.hostname for e in self._required_entries)
+
     def get_required_entries(self) -> list[HostsEntry]:
         """Get the list of hosts entries that should exist.
 
         Returns:
             List of HostsEntry objects for all services.
         """
-        entries = []
-        for service_name in self.services:
-            hostname = f"{service_name}.{self.domain}"
-            entries.append(HostsEntry(ip="127.0.0.1", hostname=hostname))
-        return entries
+        return list(self._required_entries)
 
-    def get_current_entries(self) -> list[HostsEntry]:
-        """Get the current managed entries from the hosts file.
+    def _iter_managed_pairs(self) -> Iterator[tuple[str, str]]:
+        """Yield (ip, hostname) pairs from the managed block of the hosts file.
 
-        Returns:
-            List of HostsEntry objects currently in the managed block.
+        Yields:
+            One pair per hostname; lines with several hostnames yield several pairs.
         """
-        lines = self._read_hosts_file()
+        text = self._read_hosts_text()
+        # Common first-run case: no managed block, skip line parsing entirely
+        if BEGIN_MARKER not in text:
+            return
+
+        lines = text.splitlines()
         start_idx, end_idx = self._find_managed_block(lines)
 
         if start_idx is None or end_idx is None:
-            return []
+            return
 
-        entries = []
         for line in lines[start_idx + 1 : end_idx]:
             line = line.strip()
             if line and not line.startswith("#"):
@@ -180,9 +210,23 @@ class HostsService:
                     ip = parts[0]
                     # Handle multiple hostnames on one line
                     for hostname in parts[1:]:
-                        entries.append(HostsEntry(ip=ip, hostname=hostname))
+                        yield ip, hostname
 
-        return entries
+    def _read_current_hostnames(self) -> frozenset[str]:
+        """Read the hosts file and return the hostnames in the managed block.
+
+        Returns:
+            Set of hostnames, without building HostsEntry objects.
+        """
+        return frozenset(hostname for _, hostname in self._iter_managed_pairs())
+
+    def get_current_entries(self) -> list[HostsEntry]:
+        """Get the current managed entries from the hosts file.
+
+        Returns:
+            List of HostsEntry objects currently in the managed block.
+        """
+        return [HostsEntry(ip=ip, hostname=hostname) for ip, hostname in self._iter_managed_pairs()]
 
     def get_missing_entries(self) -> list[HostsEntry]:
         """Get entries that should exist but don't.
@@ -190,11 +234,8 @@ class HostsService:
         Returns:
             List of missing HostsEntry objects.
         """
-        required = {e.hostname for e in self.get_required_entries()}
-        current = {e.hostname for e in self.get_current_entries()}
-        missing_hostnames = required - current
-
-        return [e for e in self.get_required_entries() if e.hostname in missing_hostnames]
+        current = self._read_current_hostnames()
+        return [e for e in self._required_entries if e.hostname not in current]
 
     def needs_update(self) -> bool:
         """Check if the hosts file needs to be updated.
@@ -202,9 +243,7 @@ class HostsService:
         Returns:
             True if there are missing or extra entries.
         """
-        required = {e.hostname for e in self.get_required_entries()}
-        current = {e.hostname for e in self.get_current_entries()}
-        return required != current
+        return self._required_hostnames != self._read_current_hostnames()
 
     def _build_managed_block(self) -> list[str]:
         """Build the managed block content.
@@ -213,7 +252,7 @@ class HostsService:
             List of lines for the managed block.
         """
         lines = [BEGIN_MARKER]
-        entries = self.get_required_entries()
+        entries = self._required_entries
         # Group all hostnames on one line for cleaner output
         if entries:
             hostnames = " ".join(e.hostname for e in entries)
@@ -233,8 +272,7 @@ class HostsService:
         Raises:
             HostsFileError: If the hosts file cannot be modified.
         """
-        entries = self.get_required_entries()
-        change = HostsChange(action="add", entries=entries)
+        change = HostsChange(action="add", entries=self._required_entries)
 
         if preview:
             return change
@@ -252,8 +290,9 @@ class HostsService:
         managed_block = self._build_managed_block()
 
         if start_idx is not None and end_idx is not None:
-            # Replace existing managed block
-            new_lines = lines[:start_idx] + managed_block + lines[end_idx + 1 :]
+            # Replace existing managed block in place
+            new_lines = lines
+            new_lines[start_idx : end_idx + 1] = managed_block
         elif start_idx is not None:
             # Partial block found - remove and append new
             new_lines = [line for line in lines if line.strip() != BEGIN_MARKER]
@@ -282,7 +321,7 @@ class HostsService:
             HostsFileError: If the hosts file cannot be modified.
         """
         current_entries = self.get_current_entries()
-        change = HostsChange(action="remove", entries=current_entries)
+        change = HostsChange(action="remove", entries=tuple(current_entries))
 
         if preview:
             return change
@@ -306,19 +345,18 @@ class HostsService:
             return change
 
         # Remove the managed block (including markers)
-        new_lines = lines[:start_idx] + lines[end_idx + 1 :]
-
-        # Clean up any double blank lines left behind
-        cleaned_lines = []
-        prev_blank = False
-        for line in new_lines:
-            is_blank = not line.strip()
-            if is_blank and prev_blank:
-                continue
-            cleaned_lines.append(line)
-            prev_blank = is_blank
-
-        self._write_hosts_file(cleaned_lines)
+        del lines[start_idx : end_idx + 1]
+
+        # Only the seam where the block was removed can leave a new double
+        # blank line; collapse it there and leave the rest of the file alone
+        if (
+            0 < start_idx < len(lines)
+            and not lines[start_idx - 1].strip()
+            and not lines[start_idx].strip()
+        ):
+            del lines[start_idx]
+
+        self._write_hosts_file(lines)
         return change
 
     def get_status(self) -> dict[str, bool | list[str] | str]:
@@ -327,14 +365,16 @@ class HostsService:
         Returns:
             Dictionary with status information.
         """
-        required = self.get_required_entries()
-        current = self.get_current_entries()
+        # Read the hosts file once and format lines straight from the parsed
+        # pairs, without building HostsEntry objects just to stringify them
+        current_pairs = list(self._iter_managed_pairs())
+        current_hostnames = {hostname for _, hostname in current_pairs}
 
         return {
             "hosts_file": str(self.hosts_file),
             "writable": os.access(self.hosts_file, os.W_OK),
-            "has_managed_block": len(current) > 0,
-            "needs_update": self.needs_update(),
-            "required_entries": [str(e) for e in required],
-            "current_entries": [str(e) for e in current],
+            "has_managed_block": len(current_pairs) > 0,
+            "needs_update": self._required_hostnames != current_hostnames,
+            "required_entries": [str(e) for e in self._required_entries],
+            "current_entries": [f"{ip} {hostname}" for ip, hostname in current_pairs],
         }
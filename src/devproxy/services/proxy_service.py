@@ -3,17 +3,23 @@
 import asyncio
 import contextlib
 import errno
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from mitmproxy import options
-from mitmproxy.tools.dump import DumpMaster
-from mitmproxy.tools.web.master import WebMaster
 
 from devproxy.addons.router import RequestRecord, RouterAddon
 from devproxy.models.config import ProxyConfig
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime: only the master actually used gets loaded,
+    # and the web master pulls in tornado and the web UI addons
+    from mitmproxy.tools.dump import DumpMaster
+    from mitmproxy.tools.web.master import WebMaster
+
 
 class ProxyStartError(Exception):
     """Raised when the proxy fails to start."""
@@ -26,13 +32,17 @@ class ProxyService:
 
     Handles starting/stopping the proxy with proper certificate configuration
     and subdomain routing.
+
+    Constructor arguments are fixed for the life of the service: derived
+    values such as the combined PEM path and the route labels are computed
+    once and are not refreshed if the attributes are reassigned.
     """
 
     def __init__(
         self,
         proxy_config: ProxyConfig,
         domain: str,
-        routes: dict[str, tuple[str, int]],
+        routes: Mapping[str, tuple[str, int]],
         cert_file: Path,
         key_file: Path,
         verbose: bool = False,
@@ -51,32 +61,55 @@ class ProxyService:
         """
         self.proxy_config = proxy_config
         self.domain = domain
-        self.routes = routes
+        # Snapshot the table: the cached route labels and the router addon
+        # both rely on it not changing after construction
+        self.routes: Mapping[str, tuple[str, int]] = MappingProxyType(dict(routes))
         self.cert_file = cert_file
         self.key_file = key_file
         self.verbose = verbose
         self.on_request = on_request
 
+        # mitmproxy reads cert and key from a single PEM next to the cert.
+        # Derived once, like the rest of the construction-time configuration.
+        self._combined_cert_path = cert_file.parent / f"{cert_file.stem}-combined.pem"
+
         self._master: DumpMaster | WebMaster | None = None
-        self._shutdown_event: asyncio.Event | None = None
+        # Set by shutdown(); a stopped service never starts a master again, so
+        # a signal that lands before or during start() can't be lost
+        self._shutdown_requested = False
 
     def _get_combined_cert_path(self) -> Path:
         """Create a combined PEM file with cert and key for mitmproxy.
 
         mitmproxy expects a single PEM file containing both the certificate
-        and private key. This method creates that combined file.
+        and private key. This method creates that combined file, skipping the
+        write when an up-to-date copy already exists.
 
         Returns:
             Path to the combined PEM file.
         """
-        combined_path = self.cert_file.parent / f"{self.cert_file.stem}-combined.pem"
+        combined_path = self._combined_cert_path
 
-        # Read cert and key
-        cert_content = self.cert_file.read_text()
-        key_content = self.key_file.read_text()
+        # Combined PEM is cert first, then key
+        content = self.cert_file.read_bytes() + self.key_file.read_bytes()
 
-        # Write combined PEM (cert first, then key)
-        combined_path.write_text(cert_content + key_content)
+        try:
+            if combined_path.read_bytes() == content:
+                # Older versions wrote this file with default permissions;
+                # tighten an up-to-date copy rather than leave the key exposed
+                if combined_path.stat().st_mode & 0o077:
+                    combined_path.chmod(0o600)
+                return combined_path
+        except FileNotFoundError:
+            pass
+
+        # Write via a temp file so a crash never leaves a truncated PEM. The
+        # file holds the private key, so create it readable by the owner only.
+        tmp_path = combined_path.with_name(f"{combined_path.name}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        tmp_path.touch(mode=0o600)
+        tmp_path.write_bytes(content)
+        tmp_path.replace(combined_path)
 
         return combined_path
 
@@ -116,14 +149,34 @@ class ProxyService:
             verbose=self.verbose,
         )
 
-    async def _run_master(self, master: DumpMaster | WebMaster) -> None:
-        """Run the mitmproxy master until shutdown.
+    def _create_master(self, opts: options.Options) -> "DumpMaster | WebMaster":
+        """Create the mitmproxy master for the configured mode.
+
+        Only the master module that is needed gets imported, so headless
+        runs never load the web UI stack.
 
         Args:
-            master: The master instance to run.
+            opts: Options to create the master with.
+
+        Returns:
+            A WebMaster if the web UI is enabled, otherwise a DumpMaster.
         """
-        with contextlib.suppress(asyncio.CancelledError):
-            await master.run()
+        proxy_config = self.proxy_config
+        if not proxy_config.web_ui_port:
+            from mitmproxy.tools.dump import DumpMaster
+
+            return DumpMaster(opts)
+
+        from mitmproxy.tools.web.master import WebMaster
+
+        master = WebMaster(opts)
+        # Configure web UI options AFTER WebMaster creation
+        # (WebAddon registers these options during master init)
+        master_opts = master.options
+        master_opts.web_open_browser = False
+        master_opts.web_host = proxy_config.web_ui_host
+        master_opts.web_port = proxy_config.web_ui_port
+        return master
 
     async def start(self) -> None:
         """Start the proxy server.
@@ -133,33 +186,23 @@ class ProxyService:
         """
         if self._master is not None:
             raise ProxyStartError("Proxy is already running")
+        if self._shutdown_requested:
+            return
 
         opts = self._build_options()
         router = self._create_router_addon()
+        port = self.proxy_config.https_port
 
         try:
-            # Choose master type based on web UI configuration
-            if self.proxy_config.web_ui_port:
-                self._master = WebMaster(opts)
-                # Configure web UI options AFTER WebMaster creation
-                # (WebAddon registers these options during master init)
-                self._master.options.web_open_browser = False
-                self._master.options.web_host = self.proxy_config.web_ui_host
-                self._master.options.web_port = self.proxy_config.web_ui_port
-            else:
-                self._master = DumpMaster(opts)
+            master = self._create_master(opts)
 
             # Add our routing addon
-            self._master.addons.add(router)
-
-            # Create shutdown event
-            self._shutdown_event = asyncio.Event()
+            master.addons.add(router)
 
         except OSError as e:
-            self._master = None
             if e.errno == errno.EACCES:
                 raise ProxyStartError(
-                    f"Permission denied binding to port {self.proxy_config.https_port}.\n"
+                    f"Permission denied binding to port {port}.\n"
                     f"Options:\n"
                     f"  - Use sudo: sudo devproxy up\n"
                     f"  - Use a port > 1024: devproxy up --port 6789\n"
@@ -167,28 +210,37 @@ class ProxyService:
                 ) from e
             elif e.errno == errno.EADDRINUSE:
                 raise ProxyStartError(
-                    f"Port {self.proxy_config.https_port} is already in use.\n"
-                    f"Check for other processes: lsof -i :{self.proxy_config.https_port}"
+                    f"Port {port} is already in use.\nCheck for other processes: lsof -i :{port}"
                 ) from e
             else:
                 raise ProxyStartError(f"Failed to start proxy: {e}") from e
 
+        self._master = master
+
     async def run(self) -> None:
         """Run the proxy until interrupted.
 
         This is the main entry point for running the proxy. It will block
-        until the proxy is shut down.
+        until the proxy is shut down. The proxy is started first unless
+        start() has already been called, and returns immediately if shutdown()
+        was requested before it got here.
 
         Raises:
             ProxyStartError: If the proxy fails to start.
         """
-        await self.start()
+        if self._shutdown_requested:
+            return
 
         if self._master is None:
+            await self.start()
+
+        master = self._master
+        if master is None:
             raise ProxyStartError("Proxy failed to initialize")
 
         try:
-            await self._run_master(self._master)
+            with contextlib.suppress(asyncio.CancelledError):
+                await master.run()
         except Exception as e:
             raise ProxyStartError(f"Proxy error: {e}") from e
         finally:
@@ -196,12 +248,11 @@ class ProxyService:
 
     async def shutdown(self) -> None:
         """Gracefully shut down the proxy."""
-        if self._master is not None:
-            self._master.shutdown()
+        self._shutdown_requested = True
+        master = self._master
+        if master is not None:
             self._master = None
-
-        if self._shutdown_event is not None:
-            self._shutdown_event.set()
+            master.shutdown()
 
     @property
     def web_url(self) -> str | None:
@@ -210,10 +261,21 @@ class ProxyService:
         Returns:
             The web URL with token, or None if web UI is disabled or not started.
         """
+        if self._master is None or not self.proxy_config.web_ui_port:
+            return None
+
+        # Already loaded by start() when the web UI is enabled
+        from mitmproxy.tools.web.master import WebMaster
+
         if isinstance(self._master, WebMaster):
             return self._master.web_url
         return None
 
+    @cached_property
+    def _route_labels(self) -> dict[str, str]:
+        """Route labels formatted as "host:port", built once."""
+        return {name: f"{host}:{port}" for name, (host, port) in self.routes.items()}
+
     def get_status(self) -> dict[str, Any]:
         """Get current proxy status.
 
@@ -226,6 +288,7 @@ class ProxyService:
             "web_ui_port": self.proxy_config.web_ui_port,
             "web_ui_host": self.proxy_config.web_ui_host,
             "domain": self.domain,
-            "routes": {name: f"{host}:{port}" for name, (host, port) in self.routes.items()},
+            # Plain copy: status is plain data callers may serialize or mutate
+            "routes": dict(self._route_labels),
             "cert_file": str(self.cert_file),
         }
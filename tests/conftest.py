@@ -1,8 +1,13 @@
-"""Shared test fixtures for devproxy tests."""
+"""Shared test fixtures for devproxy tests.
 
-import tempfile
-from collections.abc import Generator
+Filesystem fixtures are function-scoped and built on pytest's tmp_path, so
+no two tests (or pytest-xdist workers) ever share a path.
+"""
+
+from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -37,10 +42,9 @@ def sample_settings() -> DevProxySettings:
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path]:
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -68,3 +72,34 @@ proxy:
 """
     )
     return config_file
+
+
+@pytest.fixture
+def make_flow() -> Callable[..., SimpleNamespace]:
+    """Factory for lightweight stand-ins for mitmproxy HTTP flows.
+
+    Only the attributes RouterAddon touches are present, which keeps flow
+    tests far cheaper than MagicMock and turns typos into AttributeErrors.
+    """
+
+    def _make_flow(
+        host: str,
+        port: int = 443,
+        metadata: dict[str, Any] | None = None,
+        flow_id: str = "flow-1",
+    ) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=flow_id,
+            request=SimpleNamespace(
+                pretty_host=host,
+                host=host,
+                port=port,
+                scheme="https",
+                method="GET",
+                pretty_url=f"https://{host}/path",
+            ),
+            response=SimpleNamespace(status_code=200),
+            metadata={} if metadata is None else metadata,
+        )
+
+    return _make_flow
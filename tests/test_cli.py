@@ -0,0 +1,125 @@
+"""Tests for CLI request logging helpers."""
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+from unittest.mock import patch
+
+import pytest
+
+from devproxy.addons.router import RequestRecord
+from devproxy.cli.main import (
+    REQUEST_LOG_BATCH_SIZE,
+    LogFormat,
+    _drain_request_log,
+    _enqueue_request,
+    _flush_request_log,
+    _print_request_batch,
+)
+
+
+def _record(index: int) -> RequestRecord:
+    """Create a request record tagged with an index in its URL."""
+    return RequestRecord(
+        method="GET",
+        url=f"https://app.test.local/{index}",
+        subdomain="app",
+        target_host="localhost",
+        target_port=3000,
+        status_code=200,
+        duration_ms=1.0,
+        timestamp=0.0,
+    )
+
+
+class TestRequestLogQueue:
+    """Tests for queueing, draining and flushing request records."""
+
+    def test_enqueue_drops_oldest_when_full(self) -> None:
+        """Test that a full queue drops its oldest record for the new one."""
+        queue: asyncio.Queue[RequestRecord] = asyncio.Queue(maxsize=2)
+        for i in range(3):
+            _enqueue_request(queue, _record(i))
+
+        assert queue.qsize() == 2
+        assert [queue.get_nowait().url for _ in range(2)] == [
+            "https://app.test.local/1",
+            "https://app.test.local/2",
+        ]
+
+    def test_drain_batches_and_cancels(self) -> None:
+        """Test that queued records are printed in bounded batches until cancelled."""
+        batches: list[list[RequestRecord]] = []
+
+        async def run() -> bool:
+            queue: asyncio.Queue[RequestRecord] = asyncio.Queue()
+            for i in range(REQUEST_LOG_BATCH_SIZE + 8):
+                queue.put_nowait(_record(i))
+
+            task = asyncio.create_task(_drain_request_log(queue, LogFormat.PLAIN))
+            while not queue.empty():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            return task.cancelled()
+
+        with patch(
+            "devproxy.cli.main._print_request_batch",
+            side_effect=lambda batch, _fmt: batches.append(batch),
+        ):
+            cancelled = asyncio.run(run())
+
+        assert cancelled
+        assert [len(batch) for batch in batches] == [REQUEST_LOG_BATCH_SIZE, 8]
+        assert batches[0][0].url == "https://app.test.local/0"
+
+    def test_flush_prints_remaining(self) -> None:
+        """Test that records left in the queue are printed in one final batch."""
+        queue: asyncio.Queue[RequestRecord] = asyncio.Queue()
+        for i in range(3):
+            queue.put_nowait(_record(i))
+
+        with patch("devproxy.cli.main._print_request_batch") as mock_print:
+            _flush_request_log(queue, LogFormat.PLAIN)
+
+        assert queue.empty()
+        mock_print.assert_called_once()
+        batch, log_format = mock_print.call_args.args
+        assert [r.url for r in batch] == [f"https://app.test.local/{i}" for i in range(3)]
+        assert log_format is LogFormat.PLAIN
+
+    def test_flush_empty_queue_prints_nothing(self) -> None:
+        """Test that flushing an empty queue writes nothing."""
+        queue: asyncio.Queue[RequestRecord] = asyncio.Queue()
+
+        with patch("devproxy.cli.main._print_request_batch") as mock_print:
+            _flush_request_log(queue, LogFormat.PLAIN)
+
+        mock_print.assert_not_called()
+
+
+class TestPrintRequestBatch:
+    """Tests for the plain and JSON request log formats."""
+
+    def test_json_one_object_per_line(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that JSON output writes one record object per line."""
+        records = [_record(0), dataclasses.replace(_record(1), status_code=None)]
+
+        _print_request_batch(records, LogFormat.JSON)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert [json.loads(line) for line in lines] == [dataclasses.asdict(r) for r in records]
+        assert '"status_code": null' in lines[1]
+
+    def test_plain_uses_record_str(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that plain output writes str(record) per line."""
+        records = [_record(0), _record(1)]
+
+        _print_request_batch(records, LogFormat.PLAIN)
+
+        assert capsys.readouterr().out == "".join(f"{r}\n" for r in records)
@@ -1,5 +1,7 @@
 """Tests for devproxy data models."""
 
+import copy
+import pickle
 from pathlib import Path
 
 import pytest
@@ -42,6 +44,12 @@ class TestServiceConfig:
         config = ServiceConfig(port=3000, host="")
         assert config.host == "localhost"
 
+    def test_frozen(self) -> None:
+        """Test that service config cannot be modified after creation."""
+        config = ServiceConfig(port=3000)
+        with pytest.raises(ValidationError):
+            config.port = 4000  # type: ignore[misc]
+
 
 class TestProxyConfig:
     """Tests for ProxyConfig model."""
@@ -169,6 +177,61 @@ class TestDevProxyConfig:
         assert routes["app"] == ("localhost", 3000)
         assert routes["api"] == ("localhost", 8000)
 
+    def test_route_table_is_read_only(self) -> None:
+        """Test that the route table cannot be mutated by consumers."""
+        config = DevProxyConfig(
+            domain="test.local",
+            services={"app": 3000},  # type: ignore[arg-type]
+        )
+        routes = config.get_route_table()
+        with pytest.raises(TypeError):
+            routes["api"] = ("localhost", 8000)  # type: ignore[index]
+
+    def test_service_tables_cached(self) -> None:
+        """Test that derived service tables are built once per config."""
+        config = DevProxyConfig(
+            domain="test.local",
+            services={"app": 3000},  # type: ignore[arg-type]
+        )
+        assert config._service_tables is config._service_tables
+        assert config.get_route_table() == {"app": ("localhost", 3000)}
+
+    def test_copy_and_pickle_after_getters(self) -> None:
+        """Test that cached tables don't break copying or pickling."""
+        config = DevProxyConfig(
+            domain="test.local",
+            services={"app": 3000},  # type: ignore[arg-type]
+        )
+        config.get_route_table()
+
+        for clone in (
+            copy.deepcopy(config),
+            config.model_copy(deep=True),
+            pickle.loads(pickle.dumps(config)),
+        ):
+            assert clone == config
+            assert clone.get_route_table() == {"app": ("localhost", 3000)}
+
+    def test_model_copy_update_rebuilds_tables(self) -> None:
+        """Test that model_copy(update=...) doesn't reuse stale tables."""
+        config = DevProxyConfig(
+            domain="test.local",
+            services={"app": 3000},  # type: ignore[arg-type]
+        )
+        config.get_route_table()
+
+        updated = config.model_copy(update={"services": {"api": ServiceConfig(port=8000)}})
+
+        assert updated.get_route_table() == {"api": ("localhost", 8000)}
+        assert updated.get_service_urls() == {"api": "https://api.test.local"}
+        assert config.get_route_table() == {"app": ("localhost", 3000)}
+
+    def test_frozen(self) -> None:
+        """Test that config fields cannot be reassigned."""
+        config = DevProxyConfig(domain="test.local")
+        with pytest.raises(ValidationError):
+            config.domain = "other.local"  # type: ignore[misc]
+
     def test_domain_validation(self) -> None:
         """Test domain is cleaned up."""
         config = DevProxyConfig(domain="  .test.local.  ")
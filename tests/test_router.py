@@ -1,11 +1,16 @@
 """Tests for the mitmproxy router addon."""
 
-from unittest.mock import MagicMock
+import dataclasses
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from devproxy.addons.router import RequestRecord, RouterAddon
 
+FlowFactory = Callable[..., SimpleNamespace]
+
 
 class TestRouterAddon:
     """Tests for RouterAddon class."""
@@ -32,20 +37,23 @@ class TestRouterAddon:
         assert router._extract_subdomain("app.other.domain") is None
         assert router._extract_subdomain("test.local") is None
         assert router._extract_subdomain("localhost") is None
+        assert router._extract_subdomain(".test.local") is None
 
     def test_extract_subdomain_nested(self, router: RouterAddon) -> None:
         """Test that nested subdomains are not matched."""
         # Only single-level subdomains should match
         assert router._extract_subdomain("foo.app.test.local") is None
 
-    def test_request_routing(self, router: RouterAddon) -> None:
+    def test_extract_subdomain_cache_per_instance(self, router: RouterAddon) -> None:
+        """Test that memoized lookups don't leak between addons."""
+        assert router._extract_subdomain("app.test.local") == "app"
+        other = RouterAddon(routes={}, domain="other.local")
+        assert other._extract_subdomain("app.test.local") is None
+        assert other._extract_subdomain("app.other.local") == "app"
+
+    def test_request_routing(self, router: RouterAddon, make_flow: FlowFactory) -> None:
         """Test that requests are routed correctly."""
-        # Create a mock flow
-        flow = MagicMock()
-        flow.request.pretty_host = "app.test.local"
-        flow.request.host = "app.test.local"
-        flow.request.port = 443
-        flow.metadata = {}
+        flow = make_flow("app.test.local")
 
         router.request(flow)
 
@@ -55,13 +63,9 @@ class TestRouterAddon:
         assert flow.metadata["devproxy_subdomain"] == "app"
         assert flow.metadata["devproxy_target"] == ("localhost", 3000)
 
-    def test_request_no_route(self, router: RouterAddon) -> None:
+    def test_request_no_route(self, router: RouterAddon, make_flow: FlowFactory) -> None:
         """Test handling of requests with no matching route."""
-        flow = MagicMock()
-        flow.request.pretty_host = "unknown.test.local"
-        flow.request.host = "unknown.test.local"
-        flow.request.port = 443
-        flow.metadata = {}
+        flow = make_flow("unknown.test.local")
 
         router.request(flow)
 
@@ -69,13 +73,9 @@ class TestRouterAddon:
         assert flow.metadata.get("devproxy_unrouted") is True
         assert flow.request.host == "unknown.test.local"
 
-    def test_request_non_matching_domain(self, router: RouterAddon) -> None:
+    def test_request_non_matching_domain(self, router: RouterAddon, make_flow: FlowFactory) -> None:
         """Test handling of requests to different domains."""
-        flow = MagicMock()
-        flow.request.pretty_host = "example.com"
-        flow.request.host = "example.com"
-        flow.request.port = 443
-        flow.metadata = {}
+        flow = make_flow("example.com")
 
         router.request(flow)
 
@@ -83,7 +83,7 @@ class TestRouterAddon:
         assert "devproxy_subdomain" not in flow.metadata
         assert flow.request.host == "example.com"
 
-    def test_response_creates_record(self, router: RouterAddon) -> None:
+    def test_response_creates_record(self, router: RouterAddon, make_flow: FlowFactory) -> None:
         """Test that response handler creates request record."""
         records = []
 
@@ -93,18 +93,16 @@ class TestRouterAddon:
         router.on_request = capture_record
 
         # Setup flow
-        flow = MagicMock()
-        flow.request.method = "GET"
-        flow.request.pretty_url = "https://app.test.local/path"
-        flow.response.status_code = 200
-        flow.metadata = {
-            "devproxy_subdomain": "app",
-            "devproxy_target": ("localhost", 3000),
-        }
+        flow = make_flow(
+            "app.test.local",
+            metadata={
+                "devproxy_subdomain": "app",
+                "devproxy_target": ("localhost", 3000),
+            },
+        )
 
         # Simulate request/response cycle
-        flow_id = router._get_flow_id(flow)
-        router._request_times[flow_id] = 0  # Set start time
+        router._request_times[flow.id] = 0  # Set start time
 
         router.response(flow)
 
@@ -113,6 +111,53 @@ class TestRouterAddon:
         assert records[0].subdomain == "app"
         assert records[0].status_code == 200
 
+    def test_response_without_observers(self, router: RouterAddon, make_flow: FlowFactory) -> None:
+        """Test that timing is cleaned up even when no record is needed."""
+        flow = make_flow("app.test.local")
+        router._request_times[flow.id] = 0.0
+
+        router.response(flow)
+
+        assert flow.id not in router._request_times
+
+    def test_request_times_bounded(self, router: RouterAddon, make_flow: FlowFactory) -> None:
+        """Test that tracked request times evict the oldest entry at capacity."""
+        router._max_tracked_requests = 3
+
+        for i in range(5):
+            router.request(make_flow("example.com", flow_id=f"flow-{i}"))
+
+        assert list(router._request_times) == ["flow-2", "flow-3", "flow-4"]
+
+    def test_request_times_expire(self, router: RouterAddon, make_flow: FlowFactory) -> None:
+        """Test that orphaned request times are swept once past the TTL."""
+        router._request_times["stale"] = 0.0
+        router._request_times["also-stale"] = 1.0
+
+        flow = make_flow("example.com", flow_id="fresh")
+        with patch("devproxy.addons.router.time.monotonic", return_value=1000.0):
+            router.request(flow)
+
+        assert list(router._request_times) == ["fresh"]
+
+    def test_replayed_flow_moves_to_end(self, router: RouterAddon, make_flow: FlowFactory) -> None:
+        """Test that re-running request() for a flow keeps oldest-first order."""
+        replayed = make_flow("example.com", flow_id="replayed")
+        with patch("devproxy.addons.router.time.monotonic", return_value=1.0):
+            router.request(replayed)
+        with patch("devproxy.addons.router.time.monotonic", return_value=2.0):
+            router.request(make_flow("example.com", flow_id="other"))
+        with patch("devproxy.addons.router.time.monotonic", return_value=3.0):
+            router.request(replayed)
+
+        assert list(router._request_times.items()) == [("other", 2.0), ("replayed", 3.0)]
+
+    def test_done_clears_request_times(self, router: RouterAddon) -> None:
+        """Test that shutdown drops all tracked request times."""
+        router._request_times["pending"] = 0.0
+        router.done()
+        assert not router._request_times
+
 
 class TestRequestRecord:
     """Tests for RequestRecord dataclass."""
@@ -134,3 +179,19 @@ class TestRequestRecord:
         assert "200" in string
         assert "app" in string
         assert "localhost:3000" in string
+
+    def test_is_immutable(self) -> None:
+        """Test that request records cannot be mutated after creation."""
+        record = RequestRecord(
+            method="GET",
+            url="https://app.test.local/",
+            subdomain="app",
+            target_host="localhost",
+            target_port=3000,
+            status_code=200,
+            duration_ms=1.0,
+            timestamp=0,
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.status_code = 500  # type: ignore[misc]
+        assert not hasattr(record, "__dict__")
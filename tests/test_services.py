@@ -1,11 +1,13 @@
 """Tests for devproxy services."""
 
+import asyncio
+import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from devproxy.models.config import CertsConfig
+from devproxy.models.config import CertsConfig, ProxyConfig
 from devproxy.services.cert_service import (
     CertificateError,
     CertService,
@@ -15,6 +17,7 @@ from devproxy.services.hosts_service import (
     HostsEntry,
     HostsService,
 )
+from devproxy.services.proxy_service import ProxyService
 
 
 class TestCertService:
@@ -37,22 +40,41 @@ class TestCertService:
         with patch("subprocess.run", side_effect=FileNotFoundError):
             assert cert_service.check_mkcert_installed() is False
 
-    def test_get_cert_paths(self, cert_service: CertService) -> None:
+    def test_mkcert_probe_cached(self, cert_service: CertService) -> None:
+        """Test that mkcert -version is only run once per service."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="v1.4.4\n", stderr="")
+            assert cert_service.check_mkcert_installed() is True
+            assert cert_service.get_mkcert_version() == "v1.4.4"
+            assert mock_run.call_count == 1
+
+    def test_is_ca_installed_sees_new_ca(self, cert_service: CertService, temp_dir: Path) -> None:
+        """Test that CA detection reflects a CA installed after the first check."""
+        ca_root = temp_dir / "ca"
+        ca_root.mkdir()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=f"{ca_root}\n")
+            assert cert_service.is_ca_installed() is False
+            (ca_root / "rootCA.pem").touch()
+            assert cert_service.is_ca_installed() is True
+            assert mock_run.call_count == 1
+
+    def test_cert_paths(self, cert_service: CertService) -> None:
         """Test certificate path generation."""
-        paths = cert_service._get_cert_paths()
+        paths = cert_service.cert_paths
         assert "test_local" in str(paths.cert_file)
         assert paths.cert_file.suffix == ".pem"
         assert paths.key_file.suffix == ".pem"
         assert "-key" in str(paths.key_file)
 
-    def test_get_cert_paths_custom(self, temp_dir: Path) -> None:
+    def test_cert_paths_custom(self, temp_dir: Path) -> None:
         """Test custom certificate paths are used."""
         config = CertsConfig(
             cert_file=temp_dir / "custom.pem",
             key_file=temp_dir / "custom-key.pem",
         )
         service = CertService(config, "test.local")
-        paths = service._get_cert_paths()
+        paths = service.cert_paths
         assert paths.cert_file == temp_dir / "custom.pem"
         assert paths.key_file == temp_dir / "custom-key.pem"
 
@@ -62,7 +84,7 @@ class TestCertService:
 
     def test_certs_exist_true(self, cert_service: CertService) -> None:
         """Test certs_exist returns True when certs exist."""
-        paths = cert_service._get_cert_paths()
+        paths = cert_service.cert_paths
         paths.cert_file.parent.mkdir(parents=True, exist_ok=True)
         paths.cert_file.touch()
         paths.key_file.touch()
@@ -135,6 +157,11 @@ class TestHostsService:
         assert "api.test.local" in content
         assert "END devproxy managed block" in content
 
+    def test_change_is_hashable(self, hosts_service: HostsService) -> None:
+        """Test that a HostsChange can be hashed and compared by value."""
+        change = hosts_service.add_entries(preview=True)
+        assert hash(change) == hash(hosts_service.add_entries(preview=True))
+
     def test_add_entries_preview(self, hosts_service: HostsService) -> None:
         """Test preview mode doesn't modify file."""
         original_content = hosts_service.hosts_file.read_text()
@@ -156,6 +183,36 @@ class TestHostsService:
         assert "devproxy managed block" not in content
         assert "localhost" in content  # Original entries preserved
 
+    def test_get_missing_entries(self, hosts_service: HostsService) -> None:
+        """Test that only entries absent from the managed block are missing."""
+        hosts_service.hosts_file.write_text(
+            "127.0.0.1 localhost\n"
+            "# BEGIN devproxy managed block\n"
+            "127.0.0.1 app.test.local\n"
+            "# END devproxy managed block\n"
+        )
+        missing = hosts_service.get_missing_entries()
+        assert [e.hostname for e in missing] == ["api.test.local"]
+
+    def test_remove_entries_preserves_other_blank_lines(self, hosts_service: HostsService) -> None:
+        """Test that removal only collapses blank lines around the removed block."""
+        hosts_service.hosts_file.write_text(
+            "127.0.0.1 localhost\n"
+            "\n"
+            "\n"
+            "10.0.0.1 other\n"
+            "\n"
+            "# BEGIN devproxy managed block\n"
+            "127.0.0.1 app.test.local\n"
+            "# END devproxy managed block\n"
+            "\n"
+            "10.0.0.2 another\n"
+        )
+        hosts_service.remove_entries()
+        assert hosts_service.hosts_file.read_text() == (
+            "127.0.0.1 localhost\n\n\n10.0.0.1 other\n\n10.0.0.2 another\n"
+        )
+
     def test_needs_update_true(self, hosts_service: HostsService) -> None:
         """Test needs_update returns True when entries missing."""
         assert hosts_service.needs_update() is True
@@ -174,6 +231,16 @@ class TestHostsService:
         assert "needs_update" in status
         assert "required_entries" in status
 
+    def test_get_status_entries(self, hosts_service: HostsService) -> None:
+        """Test status lists entries as "ip hostname" lines."""
+        hosts_service.add_entries()
+        status = hosts_service.get_status()
+        expected = ["127.0.0.1 app.test.local", "127.0.0.1 api.test.local"]
+        assert status["required_entries"] == expected
+        assert status["current_entries"] == expected
+        assert status["has_managed_block"] is True
+        assert status["needs_update"] is False
+
     def test_idempotent_add(self, hosts_service: HostsService) -> None:
         """Test adding entries multiple times is idempotent."""
         hosts_service.add_entries()
@@ -187,6 +254,124 @@ class TestHostsService:
         assert content2.count("BEGIN devproxy") == 1
 
 
+class TestProxyService:
+    """Tests for ProxyService."""
+
+    @pytest.fixture
+    def proxy_service(self, temp_dir: Path) -> ProxyService:
+        """Create a ProxyService with dummy cert and key files."""
+        cert_file = temp_dir / "cert.pem"
+        key_file = temp_dir / "cert-key.pem"
+        cert_file.write_text("CERT\n")
+        key_file.write_text("KEY\n")
+        return ProxyService(
+            proxy_config=ProxyConfig(),
+            domain="test.local",
+            routes={"app": ("localhost", 3000)},
+            cert_file=cert_file,
+            key_file=key_file,
+        )
+
+    def test_get_status(self, proxy_service: ProxyService) -> None:
+        """Test status reports routes as host:port labels."""
+        status = proxy_service.get_status()
+        assert status["running"] is False
+        assert status["routes"] == {"app": "localhost:3000"}
+
+    def test_get_status_serializes(self, proxy_service: ProxyService) -> None:
+        """Test that status is plain data that serializes to JSON."""
+        status = json.loads(json.dumps(proxy_service.get_status()))
+        assert status["routes"] == {"app": "localhost:3000"}
+
+    def test_routes_snapshot(self, temp_dir: Path) -> None:
+        """Test that routes are copied into a read-only view."""
+        routes = {"app": ("localhost", 3000)}
+        service = ProxyService(
+            proxy_config=ProxyConfig(),
+            domain="test.local",
+            routes=routes,
+            cert_file=temp_dir / "cert.pem",
+            key_file=temp_dir / "cert-key.pem",
+        )
+        routes["api"] = ("localhost", 8000)
+
+        assert dict(service.routes) == {"app": ("localhost", 3000)}
+        with pytest.raises(TypeError):
+            service.routes["api"] = ("localhost", 8000)  # type: ignore[index]
+
+    def test_combined_cert_contents(self, proxy_service: ProxyService) -> None:
+        """Test that the combined PEM holds the cert followed by the key."""
+        combined = proxy_service._get_combined_cert_path()
+        assert combined.read_text() == "CERT\nKEY\n"
+        assert combined.stat().st_mode & 0o077 == 0
+
+    def test_combined_cert_not_rewritten(self, proxy_service: ProxyService) -> None:
+        """Test that an up-to-date combined PEM is left untouched."""
+        combined = proxy_service._get_combined_cert_path()
+        inode = combined.stat().st_ino
+        assert proxy_service._get_combined_cert_path().stat().st_ino == inode
+
+    def test_combined_cert_permissions_tightened(self, proxy_service: ProxyService) -> None:
+        """Test that an up-to-date but world-readable combined PEM is made owner-only."""
+        combined = proxy_service._get_combined_cert_path()
+        combined.chmod(0o644)
+
+        assert proxy_service._get_combined_cert_path() == combined
+        assert combined.stat().st_mode & 0o777 == 0o600
+
+    def test_combined_cert_refreshed(self, proxy_service: ProxyService) -> None:
+        """Test that the combined PEM is rewritten when the cert changes."""
+        proxy_service._get_combined_cert_path()
+        proxy_service.cert_file.write_text("NEWCERT\n")
+        combined = proxy_service._get_combined_cert_path()
+        assert combined.read_text() == "NEWCERT\nKEY\n"
+
+    def test_run_after_shutdown_does_not_restart(self, proxy_service: ProxyService) -> None:
+        """Test that a shutdown queued before run() stops it from starting again."""
+        master = MagicMock()
+        master.run = AsyncMock()
+
+        async def fake_start() -> None:
+            proxy_service._master = master
+
+        async def scenario() -> None:
+            await proxy_service.start()
+            await proxy_service.shutdown()
+            await proxy_service.run()
+
+        with patch.object(proxy_service, "start", side_effect=fake_start) as mock_start:
+            asyncio.run(scenario())
+
+        mock_start.assert_called_once()
+        master.shutdown.assert_called_once()
+        master.run.assert_not_awaited()
+        assert proxy_service._master is None
+
+    def test_start_after_shutdown_is_noop(self, proxy_service: ProxyService) -> None:
+        """Test that a shutdown requested before start() prevents creating a master."""
+        asyncio.run(proxy_service.shutdown())
+
+        with patch.object(ProxyService, "_create_master") as mock_create:
+            asyncio.run(proxy_service.start())
+
+        mock_create.assert_not_called()
+        assert proxy_service._master is None
+
+    def test_run_after_start(self, proxy_service: ProxyService) -> None:
+        """Test that run() reuses a master created by an earlier start()."""
+        master = MagicMock()
+        master.run = AsyncMock()
+        proxy_service._master = master
+
+        with patch.object(ProxyService, "start") as mock_start:
+            asyncio.run(proxy_service.run())
+
+        mock_start.assert_not_called()
+        master.run.assert_awaited_once()
+        master.shutdown.assert_called_once()
+        assert proxy_service._master is None
+
+
 class TestHostsEntry:
     """Tests for HostsEntry dataclass."""
 